@@ -0,0 +1,36 @@
+import { escapeTemplateLiteral } from '../templateLiteral';
+
+// Evaluate the escaped text the way a generated *Scenes.js module would.
+const roundTrip = (text) => new Function(`return \`${escapeTemplateLiteral(text)}\`;`)();
+
+describe('escapeTemplateLiteral', () => {
+  it.each([
+    ['plain prose', 'He lit a cigarette and waited.'],
+    ['backticks', 'She said `never` twice.'],
+    ['backslashes', 'C:\\cases\\001A and a trailing \\'],
+    ['interpolation markers', 'Costs ${price} or $5, not ${'],
+    ['escaped-looking sequences', '\\` \\${ \\\\ \\n \\u0041'],
+    ['line breaks', 'one\ntwo\r\nthree\rfour'],
+    ['empty text', ''],
+  ])('round-trips %s', (_label, text) => {
+    expect(roundTrip(text)).toBe(text);
+  });
+
+  it('round-trips arbitrary strings built from special characters', () => {
+    const alphabet = ['\\', '`', '$', '{', '}', '\r', '\n', 'a', ' ', '\u2028'];
+    // Small deterministic LCG so failures are reproducible.
+    let seed = 42;
+    const next = () => {
+      seed = (seed * 1103515245 + 12345) % 2147483648;
+      return seed;
+    };
+    for (let i = 0; i < 500; i += 1) {
+      const length = next() % 24;
+      let text = '';
+      for (let j = 0; j < length; j += 1) {
+        text += alphabet[next() % alphabet.length];
+      }
+      expect(roundTrip(text)).toBe(text);
+    }
+  });
+});
@@ -7,6 +7,8 @@
 const fs = require('fs');
 const path = require('path');
 const https = require('https');
+const { escapeTemplateLiteral } = require('./templateLiteral');
+const { writeFileIfChanged, writeJsonPretty } = require('./fileUtils');
 
 const MANIFEST_PATH = './src/data/manyShot/chunks_manifest.json';
 const OUTPUT_DIR = './src/data/manyShot';
@@ -108,35 +110,34 @@ Respond ONLY with valid JSON, no markdown formatting.`
 }
 
 function buildPrompt(chunks) {
-  let prompt = `Categorize these ${chunks.length} scenes from "Mystic River":\n\n`;
-
-  chunks.forEach((chunk, i) => {
-    prompt += `## Chunk ${chunk.id}\n`;
-    prompt += `[${chunk.wordCount} words]\n`;
-    prompt += `${chunk.text.substring(0, 800)}...\n\n`;
-  });
-
-  prompt += `\nFor each chunk, provide:\n`;
-  prompt += `1. Primary category (required)\n`;
-  prompt += `2. Secondary categories if applicable (max 2)\n`;
-  prompt += `3. Specific craft tags (dialogue-driven, sensory-rich, etc.)\n`;
-  prompt += `4. Quality rating (excellent/good/average)\n`;
-  prompt += `5. Brief reason for categorization\n\n`;
-  prompt += `Return ONLY this JSON structure:\n`;
-  prompt += `{\n`;
-  prompt += `  "scenes": [\n`;
-  prompt += `    {\n`;
-  prompt += `      "chunkId": "chunk_0001",\n`;
-  prompt += `      "primaryCategory": "confrontation",\n`;
-  prompt += `      "secondaryCategories": ["dialogue_tension"],\n`;
-  prompt += `      "tags": ["dialogue-driven", "psychological"],\n`;
-  prompt += `      "quality": "excellent",\n`;
-  prompt += `      "reason": "Masterful use of subtext in confrontation"\n`;
-  prompt += `    }\n`;
-  prompt += `  ]\n`;
-  prompt += `}\n`;
-
-  return prompt;
+  const chunkSections = chunks
+    .map(chunk => `## Chunk ${chunk.id}\n[${chunk.wordCount} words]\n${chunk.text.substring(0, 800)}...\n\n`)
+    .join('');
+
+  return `Categorize these ${chunks.length} scenes from "Mystic River":
+
+${chunkSections}
+For each chunk, provide:
+1. Primary category (required)
+2. Secondary categories if applicable (max 2)
+3. Specific craft tags (dialogue-driven, sensory-rich, etc.)
+4. Quality rating (excellent/good/average)
+5. Brief reason for categorization
+
+Return ONLY this JSON structure:
+{
+  "scenes": [
+    {
+      "chunkId": "chunk_0001",
+      "primaryCategory": "confrontation",
+      "secondaryCategories": ["dialogue_tension"],
+      "tags": ["dialogue-driven", "psychological"],
+      "quality": "excellent",
+      "reason": "Masterful use of subtext in confrontation"
+    }
+  ]
+}
+`;
 }
 
 function generateCategoryFiles(manifest) {
@@ -148,15 +149,18 @@ function generateCategoryFiles(manifest) {
   manifest.forEach(chunk => {
     if (!chunk.category) return;
     categorizedCount++;
-    if (!byCategory[chunk.category]) byCategory[chunk.category] = [];
-    byCategory[chunk.category].push(chunk);
+    (byCategory[chunk.category] ||= []).push(chunk);
   });
 
   console.log(`[Generate] Found ${categorizedCount} categorized chunks across ${Object.keys(byCategory).length} categories`);
 
   for (const [category, chunks] of Object.entries(byCategory)) {
-    const excellentChunks = chunks.filter(c => c.quality === 'excellent');
-    const goodChunks = chunks.filter(c => c.quality === 'good');
+    const excellentChunks = [];
+    const goodChunks = [];
+    for (const c of chunks) {
+      if (c.quality === 'excellent') excellentChunks.push(c);
+      else if (c.quality === 'good') goodChunks.push(c);
+    }
     const sortedChunks = [...excellentChunks, ...goodChunks];
 
     const exportContent = `/**
@@ -166,19 +170,19 @@ function generateCategoryFiles(manifest) {
  */
 
 export const ${category.toUpperCase()}_SCENES = [
-${sortedChunks.map(chunk => `  \`${chunk.text.replace(/`/g, '\\`')}\`,\n`).join('')}];
+${sortedChunks.map(chunk => `  \`${escapeTemplateLiteral(chunk.text)}\`,\n`).join('')}];
 
 export const ${category.toUpperCase()}_METADATA = {
-  category: '${category}',
-  description: '${SCENE_CATEGORIES[category]}',
+  category: ${JSON.stringify(category)},
+  description: ${JSON.stringify(SCENE_CATEGORIES[category])},
   totalExamples: ${sortedChunks.length},
   averageWords: ${Math.round(sortedChunks.reduce((sum, c) => sum + c.wordCount, 0) / sortedChunks.length)},
 };
 `;
 
     const filePath = path.join(OUTPUT_DIR, `${category}Scenes.js`);
-    fs.writeFileSync(filePath, exportContent, 'utf-8');
-    console.log(`[Generate]   ✅ ${category}Scenes.js: ${sortedChunks.length} scenes (${excellentChunks.length} excellent)`);
+    const written = writeFileIfChanged(filePath, exportContent);
+    console.log(`[Generate]   ${written ? '✅' : '⏭️ '} ${category}Scenes.js: ${sortedChunks.length} scenes (${excellentChunks.length} excellent)${written ? '' : ' (unchanged)'}`);
   }
 
   // Generate index
@@ -211,8 +215,11 @@ export function getMixedScenes(limit = 100) {
 }
 `;
 
-  fs.writeFileSync(path.join(OUTPUT_DIR, 'index.js'), indexContent, 'utf-8');
-  console.log('[Generate]   ✅ index.js created\n');
+  if (writeFileIfChanged(path.join(OUTPUT_DIR, 'index.js'), indexContent)) {
+    console.log('[Generate]   ✅ index.js created\n');
+  } else {
+    console.log('[Generate]   ⏭️  index.js unchanged\n');
+  }
 
   return byCategory;
 }
@@ -233,6 +240,8 @@ async function main() {
   console.log('✅ API key found\n');
 
   const manifest = JSON.parse(fs.readFileSync(MANIFEST_PATH, 'utf-8'));
+  // Index chunks by id once so each categorized scene is a direct lookup
+  const chunksById = new Map(manifest.map(chunk => [chunk.id, chunk]));
   console.log(`📚 Loaded ${manifest.length} chunks\n`);
 
   const alreadyCategorized = manifest.filter(c => c.category).length;
@@ -243,6 +252,9 @@ async function main() {
 
   const results = [];
   let processed = 0;
+  let skippedBatches = 0;
+  let manifestDirty = false;
+  let checkpointWritten = false;
   const totalBatches = Math.ceil(manifest.length / BATCH_SIZE);
 
   console.log(`Processing ${manifest.length} chunks in ${totalBatches} batches of ${BATCH_SIZE}`);
@@ -256,7 +268,7 @@ async function main() {
     // Skip if all chunks in batch already categorized
     const uncategorized = batch.filter(c => !c.category);
     if (uncategorized.length === 0) {
-      console.log(`[Batch ${batchNum}/${totalBatches}] ⏭️  Already done\n`);
+      skippedBatches++;
       continue;
     }
 
@@ -277,13 +289,14 @@ async function main() {
       const categorized = JSON.parse(cleanJson);
 
       categorized.scenes.forEach(scene => {
-        const chunkIndex = manifest.findIndex(c => c.id === scene.chunkId);
-        if (chunkIndex >= 0) {
-          manifest[chunkIndex].category = scene.primaryCategory;
-          manifest[chunkIndex].secondaryCategories = scene.secondaryCategories || [];
-          manifest[chunkIndex].tags = scene.tags || [];
-          manifest[chunkIndex].quality = scene.quality;
-          manifest[chunkIndex].categoryReason = scene.reason;
+        const chunk = chunksById.get(scene.chunkId);
+        if (chunk) {
+          chunk.category = scene.primaryCategory;
+          chunk.secondaryCategories = scene.secondaryCategories || [];
+          chunk.tags = scene.tags || [];
+          chunk.quality = scene.quality;
+          chunk.categoryReason = scene.reason;
+          manifestDirty = true;
           processed++;
         }
         results.push(scene);
@@ -292,13 +305,15 @@ async function main() {
       console.log(`[Batch ${batchNum}/${totalBatches}] ✅ Categorized ${batch.length} scenes`);
       console.log(`[Batch ${batchNum}/${totalBatches}] 📊 Progress: ${processed}/${manifest.length} (${Math.round(processed/manifest.length*100)}%)\n`);
 
-      // Save progress after each batch
-      fs.writeFileSync(MANIFEST_PATH, JSON.stringify(manifest, null, 2), 'utf-8');
+      // Save progress after each batch (compact; pretty-printed once when the run finishes)
+      fs.writeFileSync(MANIFEST_PATH, JSON.stringify(manifest), 'utf-8');
+      manifestDirty = false;
       fs.writeFileSync(
         path.join(OUTPUT_DIR, 'categorization_results.json'),
-        JSON.stringify(results, null, 2),
+        JSON.stringify(results),
         'utf-8'
       );
+      checkpointWritten = true;
 
       // Rate limiting
       if (i + BATCH_SIZE < manifest.length) {
@@ -309,8 +324,11 @@ async function main() {
       console.error(`[Batch ${batchNum}/${totalBatches}] ❌ Error: ${error.message}`);
       console.log('Progress saved. You can re-run to continue from here.\n');
 
-      // Still save progress
-      fs.writeFileSync(MANIFEST_PATH, JSON.stringify(manifest, null, 2), 'utf-8');
+      // Still save progress (nothing to write if the batch failed before touching the manifest)
+      if (manifestDirty) {
+        fs.writeFileSync(MANIFEST_PATH, JSON.stringify(manifest), 'utf-8');
+        manifestDirty = false;
+      }
 
       // Ask if should continue
       console.log('Continuing with next batch...\n');
@@ -319,8 +337,19 @@ async function main() {
 
   console.log('='.repeat(60));
   console.log(`✅ Categorization complete!`);
+  if (skippedBatches > 0) {
+    console.log(`⏭️  Skipped ${skippedBatches} already-categorized batches`);
+  }
   console.log(`📊 Processed ${processed} chunks\n`);
 
+  // Checkpoints are compact, so always leave the tracked files indent-2. This also
+  // restores them when an interrupted run is resumed with nothing left to categorize.
+  writeJsonPretty(MANIFEST_PATH, manifest);
+  writeJsonPretty(
+    path.join(OUTPUT_DIR, 'categorization_results.json'),
+    checkpointWritten ? results : undefined
+  );
+
   const byCategory = generateCategoryFiles(manifest);
 
   console.log('='.repeat(60));
@@ -328,9 +357,12 @@ async function main() {
   console.log('='.repeat(60));
 
   Object.entries(byCategory).forEach(([cat, chunks]) => {
-    const excellent = chunks.filter(c => c.quality === 'excellent').length;
-    const good = chunks.filter(c => c.quality === 'good').length;
-    const average = chunks.filter(c => c.quality === 'average').length;
+    let excellent = 0, good = 0, average = 0;
+    for (const c of chunks) {
+      if (c.quality === 'excellent') excellent++;
+      else if (c.quality === 'good') good++;
+      else if (c.quality === 'average') average++;
+    }
     console.log(`${cat.padEnd(20)} ${chunks.length.toString().padStart(3)} total (${excellent} excellent, ${good} good, ${average} average)`);
   });
 
@@ -8,6 +8,8 @@
 
 const fs = require('fs');
 const path = require('path');
+const { escapeTemplateLiteral } = require('./templateLiteral');
+const { writeFileIfChanged, writeJsonPretty } = require('./fileUtils');
 
 // Import your LLM service
 const { llmService } = require('../src/services/LLMService');
@@ -87,12 +89,15 @@ async function main() {
 
   console.log('[Categorize] Loading chunks manifest...');
   const manifest = JSON.parse(fs.readFileSync(MANIFEST_PATH, 'utf-8'));
+  // Index chunks by id once so each categorized scene is a direct lookup
+  const chunksById = new Map(manifest.map(chunk => [chunk.id, chunk]));
 
   const chunksToProcess = manifest.slice(0, MAX_CHUNKS);
   console.log(`[Categorize] Processing ${chunksToProcess.length} chunks...`);
 
   const results = [];
   let processed = 0;
+  let checkpointWritten = false;
 
   // Process in batches
   for (let i = 0; i < chunksToProcess.length; i += BATCH_SIZE) {
@@ -120,13 +125,13 @@ async function main() {
 
       // Merge results
       categorized.scenes.forEach(scene => {
-        const chunkIndex = manifest.findIndex(c => c.id === scene.chunkId);
-        if (chunkIndex >= 0) {
-          manifest[chunkIndex].category = scene.primaryCategory;
-          manifest[chunkIndex].secondaryCategories = scene.secondaryCategories || [];
-          manifest[chunkIndex].tags = scene.tags || [];
-          manifest[chunkIndex].quality = scene.quality;
-          manifest[chunkIndex].categoryReason = scene.reason;
+        const chunk = chunksById.get(scene.chunkId);
+        if (chunk) {
+          chunk.category = scene.primaryCategory;
+          chunk.secondaryCategories = scene.secondaryCategories || [];
+          chunk.tags = scene.tags || [];
+          chunk.quality = scene.quality;
+          chunk.categoryReason = scene.reason;
         }
         results.push(scene);
         processed++;
@@ -136,6 +141,7 @@ async function main() {
 
       // Save progress after each batch
       saveProgress(manifest, results);
+      checkpointWritten = true;
 
       // Rate limiting - wait 2s between batches
       if (i + BATCH_SIZE < chunksToProcess.length) {
@@ -151,6 +157,8 @@ async function main() {
   console.log('\n[Categorize] ✅ Categorization complete!');
   console.log(`[Categorize] Processed: ${processed} chunks`);
 
+  finalizeProgress(manifest, results, checkpointWritten);
+
   // Generate final output files organized by category
   generateCategoryFiles(manifest);
 }
@@ -172,40 +180,50 @@ Be precise and consistent. Categorization is for teaching AI to write noir ficti
 }
 
 function buildCategorizationPrompt(chunks) {
-  let prompt = `Categorize these ${chunks.length} scenes from "Mystic River":\n\n`;
-
-  chunks.forEach((chunk, i) => {
-    prompt += `## Chunk ${chunk.id}\n`;
-    prompt += `[${chunk.wordCount} words]\n`;
-    prompt += `${chunk.text.substring(0, 800)}...\n\n`;
-  });
-
-  prompt += `\nFor each chunk, provide:\n`;
-  prompt += `1. Primary category (required)\n`;
-  prompt += `2. Secondary categories if applicable (max 2)\n`;
-  prompt += `3. Specific craft tags (dialogue-driven, sensory-rich, etc.)\n`;
-  prompt += `4. Quality rating (excellent/good/average)\n`;
-  prompt += `5. Brief reason for categorization\n`;
-
-  return prompt;
+  const chunkSections = chunks
+    .map(chunk => `## Chunk ${chunk.id}\n[${chunk.wordCount} words]\n${chunk.text.substring(0, 800)}...\n\n`)
+    .join('');
+
+  return `Categorize these ${chunks.length} scenes from "Mystic River":
+
+${chunkSections}
+For each chunk, provide:
+1. Primary category (required)
+2. Secondary categories if applicable (max 2)
+3. Specific craft tags (dialogue-driven, sensory-rich, etc.)
+4. Quality rating (excellent/good/average)
+5. Brief reason for categorization
+`;
 }
 
+// Per-batch checkpoints are written compact; finalizeProgress pretty-prints at the end.
 function saveProgress(manifest, results) {
   // Save updated manifest
   fs.writeFileSync(
     MANIFEST_PATH,
-    JSON.stringify(manifest, null, 2),
+    JSON.stringify(manifest),
     'utf-8'
   );
 
   // Save categorization results
   fs.writeFileSync(
     path.join(OUTPUT_DIR, 'categorization_results.json'),
-    JSON.stringify(results, null, 2),
+    JSON.stringify(results),
     'utf-8'
   );
 }
 
+// Always leave the tracked files indent-2, including when an interrupted run is
+// resumed with nothing left to checkpoint. Without a checkpoint this run, the
+// results file on disk is reformatted as-is rather than replaced.
+function finalizeProgress(manifest, results, checkpointWritten) {
+  writeJsonPretty(MANIFEST_PATH, manifest);
+  writeJsonPretty(
+    path.join(OUTPUT_DIR, 'categorization_results.json'),
+    checkpointWritten ? results : undefined
+  );
+}
+
 function generateCategoryFiles(manifest) {
   console.log('\n[Categorize] Generating category files...');
 
@@ -214,18 +232,17 @@ function generateCategoryFiles(manifest) {
   // Group by primary category
   manifest.forEach(chunk => {
     if (!chunk.category) return;
-
-    if (!byCategory[chunk.category]) {
-      byCategory[chunk.category] = [];
-    }
-
-    byCategory[chunk.category].push(chunk);
+    (byCategory[chunk.category] ||= []).push(chunk);
   });
 
   // Save each category to its own file
   for (const [category, chunks] of Object.entries(byCategory)) {
-    const excellentChunks = chunks.filter(c => c.quality === 'excellent');
-    const goodChunks = chunks.filter(c => c.quality === 'good');
+    const excellentChunks = [];
+    const goodChunks = [];
+    for (const c of chunks) {
+      if (c.quality === 'excellent') excellentChunks.push(c);
+      else if (c.quality === 'good') goodChunks.push(c);
+    }
 
     // Sort by quality
     const sortedChunks = [...excellentChunks, ...goodChunks];
@@ -243,27 +260,23 @@ function generateCategoryFiles(manifest) {
 
 export const ${category.toUpperCase()}_SCENES = [
 ${sortedChunks.map(chunk => `  // ${chunk.id} - ${chunk.wordCount} words - ${chunk.tags?.join(', ') || 'no tags'}
-  \`${chunk.text.replace(/`/g, '\\`')}\`,
+  \`${escapeTemplateLiteral(chunk.text)}\`,
 `).join('\n')}
 ];
 
 export const ${category.toUpperCase()}_METADATA = {
-  category: '${category}',
-  description: '${SCENE_CATEGORIES[category]}',
+  category: ${JSON.stringify(category)},
+  description: ${JSON.stringify(SCENE_CATEGORIES[category])},
   totalExamples: ${sortedChunks.length},
   averageWords: ${Math.round(sortedChunks.reduce((sum, c) => sum + c.wordCount, 0) / sortedChunks.length)},
-  commonTags: [${[...new Set(sortedChunks.flatMap(c => c.tags || []))].map(t => `'${t}'`).join(', ')}]
+  commonTags: [${[...new Set(sortedChunks.flatMap(c => c.tags || []))].map(t => JSON.stringify(t)).join(', ')}]
 };
 `;
 
     const filename = `${category}Scenes.js`;
-    fs.writeFileSync(
-      path.join(OUTPUT_DIR, filename),
-      exportContent,
-      'utf-8'
-    );
+    const written = writeFileIfChanged(path.join(OUTPUT_DIR, filename), exportContent);
 
-    console.log(`[Categorize]    ✅ ${filename}: ${sortedChunks.length} scenes (${excellentChunks.length} excellent)`);
+    console.log(`[Categorize]    ${written ? '✅' : '⏭️ '} ${filename}: ${sortedChunks.length} scenes (${excellentChunks.length} excellent)${written ? '' : ' (unchanged)'}`);
   }
 
   // Generate index file
@@ -303,13 +316,11 @@ export function getMixedScenes(limit = 100) {
 }
 `;
 
-  fs.writeFileSync(
-    path.join(OUTPUT_DIR, 'index.js'),
-    indexContent,
-    'utf-8'
-  );
-
-  console.log(`[Categorize]    ✅ index.js: Master export file`);
+  if (writeFileIfChanged(path.join(OUTPUT_DIR, 'index.js'), indexContent)) {
+    console.log(`[Categorize]    ✅ index.js: Master export file`);
+  } else {
+    console.log(`[Categorize]    ⏭️  index.js: unchanged`);
+  }
 
   // Summary
   console.log('\n[Categorize] 📊 Summary:');
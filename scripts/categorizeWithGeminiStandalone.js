@@ -8,6 +8,8 @@
 const fs = require('fs');
 const path = require('path');
 const https = require('https');
+const { escapeTemplateLiteral } = require('./templateLiteral');
+const { writeFileIfChanged, writeJsonPretty } = require('./fileUtils');
 
 const MANIFEST_PATH = './src/data/manyShot/chunks_manifest.json';
 const OUTPUT_DIR = './src/data/manyShot';
@@ -112,59 +114,73 @@ Respond ONLY with valid JSON, no markdown formatting.`
 }
 
 function buildPrompt(chunks) {
-  let prompt = `Categorize these ${chunks.length} scenes from "Mystic River":\n\n`;
-
-  chunks.forEach((chunk, i) => {
-    prompt += `## Chunk ${chunk.id}\n`;
-    prompt += `[${chunk.wordCount} words]\n`;
-    prompt += `${chunk.text.substring(0, 800)}...\n\n`;
-  });
-
-  prompt += `\nFor each chunk, provide:\n`;
-  prompt += `1. Primary category (required)\n`;
-  prompt += `2. Secondary categories if applicable (max 2)\n`;
-  prompt += `3. Specific craft tags (dialogue-driven, sensory-rich, etc.)\n`;
-  prompt += `4. Quality rating (excellent/good/average)\n`;
-  prompt += `5. Brief reason for categorization\n\n`;
-  prompt += `Return ONLY this JSON structure:\n`;
-  prompt += `{\n`;
-  prompt += `  "scenes": [\n`;
-  prompt += `    {\n`;
-  prompt += `      "chunkId": "chunk_0001",\n`;
-  prompt += `      "primaryCategory": "confrontation",\n`;
-  prompt += `      "secondaryCategories": ["dialogue_tension"],\n`;
-  prompt += `      "tags": ["dialogue-driven", "psychological"],\n`;
-  prompt += `      "quality": "excellent",\n`;
-  prompt += `      "reason": "Masterful use of subtext in confrontation"\n`;
-  prompt += `    }\n`;
-  prompt += `  ]\n`;
-  prompt += `}\n`;
-
-  return prompt;
+  const chunkSections = chunks
+    .map(chunk => `## Chunk ${chunk.id}\n[${chunk.wordCount} words]\n${chunk.text.substring(0, 800)}...\n\n`)
+    .join('');
+
+  return `Categorize these ${chunks.length} scenes from "Mystic River":
+
+${chunkSections}
+For each chunk, provide:
+1. Primary category (required)
+2. Secondary categories if applicable (max 2)
+3. Specific craft tags (dialogue-driven, sensory-rich, etc.)
+4. Quality rating (excellent/good/average)
+5. Brief reason for categorization
+
+Return ONLY this JSON structure:
+{
+  "scenes": [
+    {
+      "chunkId": "chunk_0001",
+      "primaryCategory": "confrontation",
+      "secondaryCategories": ["dialogue_tension"],
+      "tags": ["dialogue-driven", "psychological"],
+      "quality": "excellent",
+      "reason": "Masterful use of subtext in confrontation"
+    }
+  ]
+}
+`;
 }
 
+// Per-batch checkpoints are written compact; finalizeProgress pretty-prints at the end.
 function saveProgress(manifest, results) {
-  fs.writeFileSync(MANIFEST_PATH, JSON.stringify(manifest, null, 2), 'utf-8');
+  fs.writeFileSync(MANIFEST_PATH, JSON.stringify(manifest), 'utf-8');
   fs.writeFileSync(
     path.join(OUTPUT_DIR, 'categorization_results.json'),
-    JSON.stringify(results, null, 2),
+    JSON.stringify(results),
     'utf-8'
   );
 }
 
+// Always leave the tracked files indent-2, including when an interrupted run is
+// resumed with nothing left to checkpoint. Without a checkpoint this run, the
+// results file on disk is reformatted as-is rather than replaced.
+function finalizeProgress(manifest, results, checkpointWritten) {
+  writeJsonPretty(MANIFEST_PATH, manifest);
+  writeJsonPretty(
+    path.join(OUTPUT_DIR, 'categorization_results.json'),
+    checkpointWritten ? results : undefined
+  );
+}
+
 function generateCategoryFiles(manifest) {
   console.log('\n[Categorize] Generating category files...');
 
   const byCategory = {};
   manifest.forEach(chunk => {
     if (!chunk.category) return;
-    if (!byCategory[chunk.category]) byCategory[chunk.category] = [];
-    byCategory[chunk.category].push(chunk);
+    (byCategory[chunk.category] ||= []).push(chunk);
   });
 
   for (const [category, chunks] of Object.entries(byCategory)) {
-    const excellentChunks = chunks.filter(c => c.quality === 'excellent');
-    const goodChunks = chunks.filter(c => c.quality === 'good');
+    const excellentChunks = [];
+    const goodChunks = [];
+    for (const c of chunks) {
+      if (c.quality === 'excellent') excellentChunks.push(c);
+      else if (c.quality === 'good') goodChunks.push(c);
+    }
     const sortedChunks = [...excellentChunks, ...goodChunks];
 
     const exportContent = `/**
@@ -174,18 +190,18 @@ function generateCategoryFiles(manifest) {
  */
 
 export const ${category.toUpperCase()}_SCENES = [
-${sortedChunks.map(chunk => `  \`${chunk.text.replace(/`/g, '\\`')}\`,\n`).join('')}];
+${sortedChunks.map(chunk => `  \`${escapeTemplateLiteral(chunk.text)}\`,\n`).join('')}];
 
 export const ${category.toUpperCase()}_METADATA = {
-  category: '${category}',
-  description: '${SCENE_CATEGORIES[category]}',
+  category: ${JSON.stringify(category)},
+  description: ${JSON.stringify(SCENE_CATEGORIES[category])},
   totalExamples: ${sortedChunks.length},
   averageWords: ${Math.round(sortedChunks.reduce((sum, c) => sum + c.wordCount, 0) / sortedChunks.length)},
 };
 `;
 
-    fs.writeFileSync(path.join(OUTPUT_DIR, `${category}Scenes.js`), exportContent, 'utf-8');
-    console.log(`[Categorize]    ✅ ${category}Scenes.js: ${sortedChunks.length} scenes`);
+    const written = writeFileIfChanged(path.join(OUTPUT_DIR, `${category}Scenes.js`), exportContent);
+    console.log(`[Categorize]    ${written ? '✅' : '⏭️ '} ${category}Scenes.js: ${sortedChunks.length} scenes${written ? '' : ' (unchanged)'}`);
   }
 
   // Generate index
@@ -218,8 +234,11 @@ export function getMixedScenes(limit = 100) {
 }
 `;
 
-  fs.writeFileSync(path.join(OUTPUT_DIR, 'index.js'), indexContent, 'utf-8');
-  console.log(`[Categorize]    ✅ index.js created`);
+  if (writeFileIfChanged(path.join(OUTPUT_DIR, 'index.js'), indexContent)) {
+    console.log(`[Categorize]    ✅ index.js created`);
+  } else {
+    console.log(`[Categorize]    ⏭️  index.js unchanged`);
+  }
 
   console.log('\n[Categorize] 📊 Summary:');
   Object.entries(byCategory).forEach(([cat, chunks]) => {
@@ -242,10 +261,13 @@ async function main() {
   console.log(`[Categorize] Processing up to ${MAX_CHUNKS} chunks...\n`);
 
   const manifest = JSON.parse(fs.readFileSync(MANIFEST_PATH, 'utf-8'));
+  // Index chunks by id once so each categorized scene is a direct lookup
+  const chunksById = new Map(manifest.map(chunk => [chunk.id, chunk]));
   const chunksToProcess = manifest.slice(0, MAX_CHUNKS);
 
   const results = [];
   let processed = 0;
+  let checkpointWritten = false;
 
   for (let i = 0; i < chunksToProcess.length; i += BATCH_SIZE) {
     const batch = chunksToProcess.slice(i, i + BATCH_SIZE);
@@ -269,13 +291,13 @@ async function main() {
       const categorized = JSON.parse(cleanJson);
 
       categorized.scenes.forEach(scene => {
-        const chunkIndex = manifest.findIndex(c => c.id === scene.chunkId);
-        if (chunkIndex >= 0) {
-          manifest[chunkIndex].category = scene.primaryCategory;
-          manifest[chunkIndex].secondaryCategories = scene.secondaryCategories || [];
-          manifest[chunkIndex].tags = scene.tags || [];
-          manifest[chunkIndex].quality = scene.quality;
-          manifest[chunkIndex].categoryReason = scene.reason;
+        const chunk = chunksById.get(scene.chunkId);
+        if (chunk) {
+          chunk.category = scene.primaryCategory;
+          chunk.secondaryCategories = scene.secondaryCategories || [];
+          chunk.tags = scene.tags || [];
+          chunk.quality = scene.quality;
+          chunk.categoryReason = scene.reason;
         }
         results.push(scene);
         processed++;
@@ -284,6 +306,7 @@ async function main() {
       console.log(`[Batch ${batchNum}/${totalBatches}] ✅ Complete (${processed}/${chunksToProcess.length} total)\n`);
 
       saveProgress(manifest, results);
+      checkpointWritten = true;
 
       // Rate limiting
       if (i + BATCH_SIZE < chunksToProcess.length) {
@@ -299,6 +322,8 @@ async function main() {
   console.log('\n[Categorize] ✅ Categorization complete!');
   console.log(`[Categorize] Processed: ${processed} chunks`);
 
+  finalizeProgress(manifest, results, checkpointWritten);
+
   generateCategoryFiles(manifest);
 
   console.log('\n[Categorize] 🎉 Done! Files created in src/data/manyShot/');
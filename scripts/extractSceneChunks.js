@@ -104,8 +104,9 @@ fs.writeFileSync(
 console.log(`[Extract] ✅ Saved manifest to ${OUTPUT_DIR}/chunks_manifest.json`);
 
 // Stats
-const avgWords = chunks.reduce((sum, c) => sum + c.wordCount, 0) / chunks.length;
+const totalWords = chunks.reduce((sum, c) => sum + c.wordCount, 0);
+const avgWords = totalWords / chunks.length;
 console.log(`[Extract] Stats:`);
 console.log(`[Extract]    Total chunks: ${chunks.length}`);
 console.log(`[Extract]    Avg words per chunk: ${Math.round(avgWords)}`);
-console.log(`[Extract]    Total words covered: ${chunks.reduce((sum, c) => sum + c.wordCount, 0).toLocaleString()}`);
+console.log(`[Extract]    Total words covered: ${totalWords.toLocaleString()}`);
@@ -0,0 +1,36 @@
+/**
+ * Shared file helpers for the many-shot generator scripts.
+ * Plain Node.js, no dependencies.
+ */
+
+const fs = require('fs');
+
+// Re-runs usually regenerate identical files; skip the write when nothing changed.
+// Returns true when the file was written.
+function writeFileIfChanged(filePath, content) {
+  try {
+    if (fs.readFileSync(filePath, 'utf-8') === content) return false;
+  } catch (err) {
+    if (err.code !== 'ENOENT') throw err;
+  }
+  fs.writeFileSync(filePath, content, 'utf-8');
+  return true;
+}
+
+// Rewrite a JSON file with indent 2. Without `data` the file's own contents are
+// reformatted, and a missing file is left alone. Returns true when the file was written.
+function writeJsonPretty(filePath, data) {
+  if (data === undefined) {
+    let raw;
+    try {
+      raw = fs.readFileSync(filePath, 'utf-8');
+    } catch (err) {
+      if (err.code === 'ENOENT') return false;
+      throw err;
+    }
+    data = JSON.parse(raw);
+  }
+  return writeFileIfChanged(filePath, JSON.stringify(data, null, 2));
+}
+
+module.exports = { writeFileIfChanged, writeJsonPretty };
@@ -0,0 +1,12 @@
+/**
+ * Shared helper for the scene generators that emit text as JS template literals.
+ * Plain Node.js, no dependencies.
+ */
+
+// Escape text for a generated template literal: backslashes, backticks and `${`.
+// Carriage returns become `\r` because template literals normalize raw CR/CRLF to LF.
+function escapeTemplateLiteral(text) {
+  return text.replace(/\\|`|\$\{|\r/g, match => (match === '\r' ? '\\r' : `\\${match}`));
+}
+
+module.exports = { escapeTemplateLiteral };
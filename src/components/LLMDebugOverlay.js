@@ -84,11 +84,11 @@ export default function LLMDebugOverlay({ visible, onClose }) {
       }
 
       setLogs(prev => {
-        const next = [...prev, entry];
-        // Keep only recent logs
-        while (next.length > MAX_VISIBLE_LOGS) {
-          next.shift();
-        }
+        // Keep only recent logs (drop the overflow in one slice rather than shifting)
+        const next = prev.length >= MAX_VISIBLE_LOGS
+          ? prev.slice(prev.length - MAX_VISIBLE_LOGS + 1)
+          : prev.slice();
+        next.push(entry);
         return next;
       });
 
@@ -10,6 +10,12 @@ import { BRANCHING_OUTLIER_SETS } from './branchingOutliers';
 import { isDynamicChapter, normalizeStoryPathKey, parseCaseNumber } from './storyContent';
 import { getGeneratedEntry } from '../storage/generatedStoryStorage';
 
+// Theme fallbacks for the two generated decision options, in option order
+const BRANCHING_OPTION_FALLBACKS = [
+  { name: 'OPTION A', summary: 'Option A' },
+  { name: 'OPTION B', summary: 'Option B' },
+];
+
 /**
  * Get branching outlier sets for a case (sync version for Chapter 1)
  */
@@ -22,20 +28,13 @@ export function getBranchingOutlierSets(caseNumber, pathKey) {
     const normalizedKey = normalizeStoryPathKey(pathKey);
 
     // Try path-specific, then ROOT
-    if (caseData[normalizedKey]) {
-      return {
-        attempts: caseData.attempts || 5,
-        ...caseData[normalizedKey],
-      };
-    }
-    if (caseData['ROOT']) {
-      return {
-        attempts: caseData.attempts || 5,
-        ...caseData['ROOT'],
-      };
-    }
+    const pathData = caseData[normalizedKey] || caseData['ROOT'];
+    if (!pathData) return null;
 
-    return null;
+    return {
+      attempts: caseData.attempts || 5,
+      ...pathData,
+    };
   }
 
   // For dynamic chapters, return null (use async version)
@@ -95,39 +94,23 @@ function buildBranchingFromGenerated(entry) {
   const outlierWords = board.outlierWords || [];
 
   // Split outliers between the two options (4 each for decision points)
-  const set1Words = outlierWords.slice(0, 4);
-  const set2Words = outlierWords.slice(4, 8);
-
-  const sets = [
-    {
-      optionKey: decision.options[0].key,
-      label: decision.options[0].key,
-      theme: {
-        name: decision.options[0].title?.slice(0, 12).toUpperCase() || 'OPTION A',
-        icon: '\ud83d\udd2e',
-        summary: decision.options[0].title || 'Option A',
-      },
-      words: set1Words,
-      descriptions: set1Words.reduce((acc, word) => {
-        acc[word] = `Part of the '${decision.options[0].key}' path choice.`;
-        return acc;
-      }, {}),
-    },
-    {
-      optionKey: decision.options[1].key,
-      label: decision.options[1].key,
+  const sets = decision.options.slice(0, 2).map(({ key, title }, index) => {
+    const words = outlierWords.slice(index * 4, index * 4 + 4);
+    const fallback = BRANCHING_OPTION_FALLBACKS[index];
+    // Every word in a set shares the same description, so format it once per option
+    const description = `Part of the '${key}' path choice.`;
+    return {
+      optionKey: key,
+      label: key,
       theme: {
-        name: decision.options[1].title?.slice(0, 12).toUpperCase() || 'OPTION B',
+        name: title?.slice(0, 12).toUpperCase() || fallback.name,
         icon: '\ud83d\udd2e',
-        summary: decision.options[1].title || 'Option B',
+        summary: title || fallback.summary,
       },
-      words: set2Words,
-      descriptions: set2Words.reduce((acc, word) => {
-        acc[word] = `Part of the '${decision.options[1].key}' path choice.`;
-        return acc;
-      }, {}),
-    },
-  ];
+      words,
+      descriptions: Object.fromEntries(words.map(word => [word, description])),
+    };
+  });
 
   return {
     attempts: 5,
@@ -145,9 +128,7 @@ export async function getAllOutlierWordsAsync(caseNumber, pathKey) {
     return [];
   }
 
-  return branchingData.sets.reduce((all, set) => {
-    return [...all, ...(set.words || [])];
-  }, []);
+  return branchingData.sets.flatMap(set => set.words || []);
 }
 
 /**
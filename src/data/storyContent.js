@@ -8,6 +8,10 @@ export const ROOT_PATH_KEY = 'ROOT';
 // Chapter 1A is static, all other subchapters (1B, 1C, and chapters 2-12) are dynamically generated
 const FIRST_FULLY_DYNAMIC_CHAPTER = 2;
 
+// Subchapter letter <-> index tables, built once instead of per call.
+const SUBCHAPTER_LETTERS = ['A', 'B', 'C'];
+const SUBCHAPTER_BY_LETTER = { A: 1, B: 2, C: 3 };
+
 /**
  * Check if a case number requires dynamic generation.
  * Chapter 1A is static; Chapter 1B, 1C, and all of chapters 2-12 are dynamic.
@@ -48,7 +52,7 @@ export function parseCaseNumber(caseNumber) {
   const chapterSegment = caseNumber.slice(0, 3);
   const letter = caseNumber.slice(3, 4);
   const chapter = parseInt(chapterSegment, 10) || 1;
-  const subchapter = { 'A': 1, 'B': 2, 'C': 3 }[letter] || 1;
+  const subchapter = SUBCHAPTER_BY_LETTER[letter] || 1;
   return { chapter, subchapter };
 }
 
@@ -59,7 +63,6 @@ export function normalizeStoryPathKey(token) {
   const cleaned = String(token)
     .replace(/super-path/gi, '')
     .replace(/path/gi, '')
-    .replace(/\s+/g, '')
     .replace(/[^a-zA-Z0-9]/g, '')
     .toUpperCase();
   return cleaned || ROOT_PATH_KEY;
@@ -147,8 +150,7 @@ export function resolveStoryPathKey(caseNumber, storyCampaign) {
 }
 
 export function formatCaseNumber(chapter, subchapter) {
-  const letters = ['A', 'B', 'C'];
-  const letter = letters[subchapter - 1] || letters[0];
+  const letter = SUBCHAPTER_LETTERS[subchapter - 1] || SUBCHAPTER_LETTERS[0];
   return `${String(chapter).padStart(3, '0')}${letter}`;
 }
 
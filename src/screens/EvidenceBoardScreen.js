@@ -72,6 +72,18 @@ const POLAROID_IMAGES = {
   sparkle: require("../../assets/images/characters/portraits/sparkle.png"),
   voice: require("../../assets/images/characters/portraits/voice.png"),
 };
+// Portraits used for the fallback polaroids (previous-case recap vs. first case).
+const DEFAULT_META_POLAROID_KEYS = ["keeper", "voice", "buyer"];
+const DEFAULT_GENERIC_POLAROID_KEYS = ["lex", "sparkle", "silence"];
+const formatPolaroidLine = (line) => buildPolaroidLabel([line], POLAROID_LABEL_WORD_LIMIT);
+// Board spacing per size class; unknown classes fall back to "large".
+const BOARD_SIZE_CONFIG = {
+  tablet: { surface: 24, vertical: 28, frame: 26, board: 20, noteV: 12, noteH: SPACING.xl, tile: 8, navSlot: 148, string: 3, polaroid: 154, footer: SPACING.xl, contentMaxWidth: 720 },
+  xsmall: { surface: 10, vertical: 14, frame: 11, board: 10, noteV: 6, noteH: 18, tile: 2.5, navSlot: 88, string: 1.2, polaroid: 112, footer: SPACING.md, contentMaxWidth: 420 },
+  small: { surface: 12, vertical: 16, frame: 13, board: 12, noteV: 7, noteH: 20, tile: 3, navSlot: 96, string: 1.4, polaroid: 126, footer: SPACING.md, contentMaxWidth: 460 },
+  medium: { surface: 14, vertical: 20, frame: 15, board: 14, noteV: 8, noteH: 22, tile: 3.5, navSlot: 106, string: 1.8, polaroid: 138, footer: SPACING.lg, contentMaxWidth: 520 },
+  large: { surface: 16, vertical: 22, frame: 17, board: 16, noteV: 9, noteH: SPACING.lg, tile: 4, navSlot: 118, string: 2.1, polaroid: 148, footer: SPACING.lg, contentMaxWidth: 560 },
+};
 
 export default function EvidenceBoardScreen({
   activeCase,
@@ -308,20 +320,18 @@ export default function EvidenceBoardScreen({
   }, [previousCaseData]);
 
   const defaultPolaroids = useMemo(() => {
-    const formatLine = (line) => buildPolaroidLabel([line], POLAROID_LABEL_WORD_LIMIT);
     if (previousCaseMeta) {
       const rawLines = [
         `Case ${previousCaseMeta.caseNumber}: ${previousCaseMeta.title || "Unnamed"}`,
         previousCaseMeta.mainTheme ? `Theme: ${previousCaseMeta.mainTheme}` : "Theme: Unknown",
         previousCaseMeta.outlierTheme ? `Outlier: ${previousCaseMeta.outlierTheme}` : "Outlier: Unknown",
       ];
-      const keys = ["keeper", "voice", "buyer"];
-      return keys.map((imageKey, index) => {
+      return DEFAULT_META_POLAROID_KEYS.map((imageKey, index) => {
         const selectedLine = rawLines[index] ?? rawLines[rawLines.length - 1] ?? "";
         return {
           id: `default-meta-${index}`,
           imageKey,
-          label: formatLine(selectedLine),
+          label: formatPolaroidLine(selectedLine),
         };
       });
     }
@@ -330,13 +340,12 @@ export default function EvidenceBoardScreen({
       "Stay sharp, detective.",
       "Complete the case to unlock intel.",
     ];
-    const keys = ["lex", "sparkle", "silence"];
-    return keys.map((imageKey, index) => {
+    return DEFAULT_GENERIC_POLAROID_KEYS.map((imageKey, index) => {
       const selectedLine = rawLines[index] ?? rawLines[rawLines.length - 1] ?? "";
       return {
         id: `default-generic-${index}`,
         imageKey,
-        label: formatLine(selectedLine),
+        label: formatPolaroidLine(selectedLine),
       };
     });
   }, [previousCaseMeta, caseNumberLabel, caseTitle]);
@@ -344,6 +353,7 @@ export default function EvidenceBoardScreen({
   const unlockedPolaroids = useMemo(() => {
     const entries = previousCaseData?.evidenceBoard?.polaroids;
     if (!Array.isArray(entries) || !entries.length) return null;
+    const fallbackIdPrefix = `previous-${previousCaseMeta?.caseNumber ?? previousCaseData?.id}-`;
     return entries.map((item, index) => {
         if (!item) return null;
         const lines = [];
@@ -352,7 +362,7 @@ export default function EvidenceBoardScreen({
         if (!lines.length && item.label) lines.push(item.label);
         const labelText = buildPolaroidLabel(lines, POLAROID_LABEL_WORD_LIMIT);
         return {
-          id: item.id || `previous-${previousCaseMeta?.caseNumber ?? previousCaseData?.id}-${index}`,
+          id: item.id || fallbackIdPrefix + index,
                     imageKey: item.imageKey || null,
                     label: labelText,
                     detail: item.detail || null,
@@ -450,18 +460,7 @@ export default function EvidenceBoardScreen({
     }
   }, [activeCase?.caseNumber, solved, failed]);
 
-  const sizeConfig = useMemo(() => {
-    if (isTablet) {
-      return { surface: 24, vertical: 28, frame: 26, board: 20, noteV: 12, noteH: SPACING.xl, tile: 8, navSlot: 148, string: 3, polaroid: 154, footer: SPACING.xl, contentMaxWidth: 720 };
-    }
-    switch (sizeClass) {
-      case "xsmall": return { surface: 10, vertical: 14, frame: 11, board: 10, noteV: 6, noteH: 18, tile: 2.5, navSlot: 88, string: 1.2, polaroid: 112, footer: SPACING.md, contentMaxWidth: 420 };
-      case "small": return { surface: 12, vertical: 16, frame: 13, board: 12, noteV: 7, noteH: 20, tile: 3, navSlot: 96, string: 1.4, polaroid: 126, footer: SPACING.md, contentMaxWidth: 460 };
-      case "medium": return { surface: 14, vertical: 20, frame: 15, board: 14, noteV: 8, noteH: 22, tile: 3.5, navSlot: 106, string: 1.8, polaroid: 138, footer: SPACING.lg, contentMaxWidth: 520 };
-      case "large":
-      default: return { surface: 16, vertical: 22, frame: 17, board: 16, noteV: 9, noteH: SPACING.lg, tile: 4, navSlot: 118, string: 2.1, polaroid: 148, footer: SPACING.lg, contentMaxWidth: 560 };
-    }
-  }, [isTablet, sizeClass]);
+  const sizeConfig = isTablet ? BOARD_SIZE_CONFIG.tablet : BOARD_SIZE_CONFIG[sizeClass] || BOARD_SIZE_CONFIG.large;
 
   const horizontalPadding = scaleSpacing(sizeConfig.surface);
   const verticalPadding = scaleSpacing(sizeConfig.vertical);
@@ -591,13 +590,14 @@ export default function EvidenceBoardScreen({
   const polaroidEntries = useMemo(() => {
     const sourceList = unlockedPolaroids?.length ? unlockedPolaroids : defaultPolaroids;
     if (!sourceList?.length) return [];
+    const caseKey = previousCaseMeta?.caseNumber ?? "default";
     return polaroidSlots.map((slot, index) => {
       const sourceData = sourceList[index] || sourceList[sourceList.length - 1];
       const fallbackData = defaultPolaroids[index] || defaultPolaroids[defaultPolaroids.length - 1] || null;
       const labelText = sourceData?.label && sourceData.label.trim().length ? sourceData.label : fallbackData?.label || "";
       const imageKey = sourceData?.imageKey || fallbackData?.imageKey || "default";
       return {
-        id: `polaroid-${slot.id}-${previousCaseMeta?.caseNumber ?? "default"}-${sourceData?.id ?? index}`,
+        id: `polaroid-${slot.id}-${caseKey}-${sourceData?.id ?? index}`,
         image: POLAROID_IMAGES[imageKey] || POLAROID_IMAGES.default,
         label: labelText,
         detail: sourceData?.detail || null,
@@ -14,6 +14,9 @@ export const TRUNCATE_VALIDATION = 3000; // For full narrative in validation con
 export const TRUNCATE_DESCRIPTION = 300; // For thread/choice descriptions
 export const TRUNCATE_PREVIEW = 100; // For short previews/logging
 
+// Narrative thread types that always demand on-page follow-through
+export const URGENT_THREAD_TYPES = new Set(['appointment', 'promise', 'threat']);
+
 // ============================================================================
 // PATH PERSONALITY SYSTEM - Tracks cumulative player behavior for coherent narrative
 // ============================================================================
@@ -67,6 +67,46 @@ const normalizeBranchingChoices = (choices = []) => {
     .filter(Boolean);
 };
 
+// Helpers for the pathDecisions second call (labels/keywords only, never narrative text).
+const PATH_KEYWORD_STOPWORDS = new Set([
+  'the','a','an','and','or','to','of','in','on','for','with','at','from','into','over','under','before','after',
+  'he','she','they','him','her','them','his','their','its','this','that','these','those','as','is','be','been','being',
+  'jack','halloway','now','then',
+]);
+
+// Infer tone from a choice label
+const inferTone = (label) => {
+  const lower = (label || '').toLowerCase();
+  if (lower.includes('confront') || lower.includes('demand') || lower.includes('force') || lower.includes('direct')) return 'aggressive/direct approach';
+  if (lower.includes('investigate') || lower.includes('gather') || lower.includes('wait') || lower.includes('careful')) return 'cautious/methodical approach';
+  return 'balanced approach';
+};
+
+// Scans 4+ char alphanumeric runs lazily and stops as soon as `max` keywords are found.
+const extractKeywords = (text, max = 10) => {
+  const lower = String(text || '').toLowerCase();
+  const tokenRe = /[a-z0-9]{4,}/g;
+  const uniq = new Set();
+  let match;
+  while ((match = tokenRe.exec(lower)) !== null) {
+    const t = match[0];
+    if (PATH_KEYWORD_STOPWORDS.has(t)) continue;
+    uniq.add(t);
+    if (uniq.size >= max) break;
+  }
+  return [...uniq];
+};
+
+const getEvidenceCards = (details) => {
+  const cards = [];
+  const arr = Array.isArray(details) ? details : [];
+  for (const d of arr) {
+    const label = String(d?.evidenceCard || '').trim();
+    if (label && !cards.includes(label)) cards.push(label);
+  }
+  return cards;
+};
+
 /**
  * Generate decision structure first (Pass 1 of two-pass generation)
  * This ensures decisions are always complete and contextually appropriate,
@@ -606,14 +646,6 @@ async function generateSubchapter(chapter, subchapter, pathKey, choiceHistory =
           const firstChoiceOpts = bn.firstChoice?.options || [];
           const secondChoices = bn.secondChoices || [];
 
-          // Helper to infer tone from choice label
-          const inferTone = (label) => {
-            const lower = (label || '').toLowerCase();
-            if (lower.includes('confront') || lower.includes('demand') || lower.includes('force') || lower.includes('direct')) return 'aggressive/direct approach';
-            if (lower.includes('investigate') || lower.includes('gather') || lower.includes('wait') || lower.includes('careful')) return 'cautious/methodical approach';
-            return 'balanced approach';
-          };
-
           // Build path summaries from the generated branching narrative
           // Uses the new 'summary' field (15-25 words each) instead of full narrative excerpts
           const pathSummaryMap = {};
@@ -630,35 +662,6 @@ async function generateSubchapter(chapter, subchapter, pathKey, choiceHistory =
 
           // Build richer structured notes without echoing full narrative (avoids RECITATION).
           // We include: per-path labels, summaries, evidence card labels, and extracted keywords.
-          const extractKeywords = (text, max = 10) => {
-            const STOP = new Set([
-              'the','a','an','and','or','to','of','in','on','for','with','at','from','into','over','under','before','after',
-              'he','she','they','him','her','them','his','their','its','this','that','these','those','as','is','be','been','being',
-              'jack','halloway','now','then',
-            ]);
-            const tokens = String(text || '')
-              .toLowerCase()
-              .split(/[^a-z0-9]+/g)
-              .map((t) => t.trim())
-              .filter((t) => t && t.length >= 4 && !STOP.has(t));
-            const uniq = [];
-            for (const t of tokens) {
-              if (!uniq.includes(t)) uniq.push(t);
-              if (uniq.length >= max) break;
-            }
-            return uniq;
-          };
-
-          const getEvidenceCards = (details) => {
-            const cards = [];
-            const arr = Array.isArray(details) ? details : [];
-            for (const d of arr) {
-              const label = String(d?.evidenceCard || '').trim();
-              if (label && !cards.includes(label)) cards.push(label);
-            }
-            return cards;
-          };
-
           const firstChoiceByKey = {};
           for (const opt of firstChoiceOpts) {
             if (opt?.key) firstChoiceByKey[String(opt.key).toUpperCase()] = opt;
@@ -725,11 +728,13 @@ async function generateSubchapter(chapter, subchapter, pathKey, choiceHistory =
           );
 
           // Log what context we're sending
-          console.log('[StoryGenerationService] 📋 pathDecisions second call context:');
-          console.log(`  - First choices: ${firstChoiceOpts.map(o => `"${o?.label || '?'}" (${o?.summary ? 'has summary' : 'no summary'})`).join(', ')}`);
-          console.log(`  - Path summaries: ${secondChoices.reduce((sum, sc) => sum + (sc.options?.filter(o => o?.summary)?.length || 0), 0)}/9 have summaries`);
-          console.log(`  - Base decision: "${generatedContent.decision?.optionA?.title}" vs "${generatedContent.decision?.optionB?.title}"`);
-          console.log(`  - Prompt length: ${pathDecisionsPrompt.length} chars (uses summaries, not full narrative)`);
+          console.log([
+            '[StoryGenerationService] 📋 pathDecisions second call context:',
+            `  - First choices: ${firstChoiceOpts.map(o => `"${o?.label || '?'}" (${o?.summary ? 'has summary' : 'no summary'})`).join(', ')}`,
+            `  - Path summaries: ${secondChoices.reduce((sum, sc) => sum + (sc.options?.filter(o => o?.summary)?.length || 0), 0)}/9 have summaries`,
+            `  - Base decision: "${generatedContent.decision?.optionA?.title}" vs "${generatedContent.decision?.optionB?.title}"`,
+            `  - Prompt length: ${pathDecisionsPrompt.length} chars (uses summaries, not full narrative)`,
+          ].join('\n'));
 
           // UNDER-MAP: weave the next chapter's decisions around the living map —
           // the fragments collected, truths revealed, and theory sealed.
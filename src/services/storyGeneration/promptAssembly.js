@@ -19,6 +19,7 @@ import {
   PATH_PERSONALITY_TRAITS,
   TOTAL_CHAPTERS,
   TRUNCATE_DESCRIPTION,
+  URGENT_THREAD_TYPES,
 } from './constants';
 import {
   STYLE_EXAMPLES,
@@ -1610,8 +1611,7 @@ ${context.establishedFacts.slice(0, maxFacts).map(f => `- ${f}`).join('\n')}`;
         if (isOverdue) priority += 5;
 
         // Type bonus (appointments/promises/threats are more urgent)
-        const urgentTypes = ['appointment', 'promise', 'threat'];
-        if (urgentTypes.includes(t.type)) priority += 1;
+        if (URGENT_THREAD_TYPES.has(t.type)) priority += 1;
 
         return { ...t, priority, isOverdue };
       })
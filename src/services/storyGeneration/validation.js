@@ -8,10 +8,114 @@ import {
 } from '../../data/storyBible';
 import { saveStoryContext } from '../../storage/generatedStoryStorage';
 import { DECISION_CONTENT_SCHEMA, STORY_CONTENT_SCHEMA } from './schemas';
-import { DECISION_SUBCHAPTER, MIN_WORDS_PER_SUBCHAPTER, TRUNCATE_VALIDATION } from './constants';
+import {
+  DECISION_SUBCHAPTER,
+  MIN_WORDS_PER_SUBCHAPTER,
+  TRUNCATE_VALIDATION,
+  URGENT_THREAD_TYPES,
+} from './constants';
 import { formatSubchapterLabel } from './helpers';
 import { isLayer1Partial } from './lazyBranching';
 
+// Static pattern tables for the narrative checks below. Built once at module load
+// instead of on every validation pass.
+
+// Relative time references that could cause timeline drift
+const RELATIVE_TIME_PATTERNS = [
+  { pattern: /(?:nearly|almost|about|roughly)\s+(?:a\s+)?decade/i, issue: 'Avoid vague time references like "nearly a decade" - use exact durations' },
+  { pattern: /(?:many|several|countless)\s+years\s+(?:ago|since)/i, issue: 'Avoid vague "many/several years" - use exact durations from ABSOLUTE_FACTS' },
+];
+
+// Fantasy/medieval drift that breaks the noir setting
+const SETTING_VIOLATION_PATTERNS = [
+  { pattern: /\b(?:elf|elves|dwarf|dwarves|orc|orcs|goblin|goblins)\b/i, issue: 'Forbidden Tolkien-style fantasy element detected' },
+  { pattern: /\b(?:kingdom|castle|feudal|knight|sword\s+and\s+sorcery)\b/i, issue: 'Forbidden medieval-fantasy setting drift detected' },
+];
+
+// Forbidden writing patterns (reported as warnings). `count` entries must stay /g for match().
+const FORBIDDEN_WRITING_PATTERNS = [
+  { pattern: /—/g, issue: 'Em dashes (—) found - use commas, periods, or semicolons instead', count: true },
+  // "Not just X; it's Y" AI patterns - extremely common LLM output
+  { pattern: /\bis not just\b.*\bit'?s\b/i, issue: 'Forbidden pattern: "X is not just Y, it\'s Z"' },
+  { pattern: /\bwasn'?t just\b.*;\s*it was\b/i, issue: 'Forbidden AI pattern: "It wasn\'t just X; it was Y"' },
+  { pattern: /\bdidn'?t just\b.*;\s*it\b/i, issue: 'Forbidden AI pattern: "It didn\'t just X; it Y"' },
+  { pattern: /\bnot just\b.*\bbut\b/i, issue: 'Forbidden pattern: "not just...but" construction' },
+  { pattern: /\bmore than just\b/i, issue: 'Forbidden pattern: "more than just"' },
+  { pattern: /\bin a world where\b/i, issue: 'Forbidden phrase: "In a world where..."' },
+  { pattern: /\blittle did (?:he|she|they|i|we) know\b/i, issue: 'Forbidden phrase: "Little did [anyone] know..."' },
+  { pattern: /\bi couldn'?t help but\b/i, issue: 'Forbidden phrase: "I couldn\'t help but..."' },
+  { pattern: /\bi found myself\b/i, issue: 'Forbidden phrase: "I found myself..."' },
+  { pattern: /\bseemingly\b|\binterestingly\b|\bnotably\b|\bcertainly\b|\bundoubtedly\b/i, issue: 'Forbidden flowery adverbs detected' },
+  { pattern: /\bundeniably\b|\bprofoundly\b|\bunmistakably\b|\binherently\b/i, issue: 'Forbidden AI-ism adverbs detected (undeniably, profoundly, unmistakably, inherently)' },
+  { pattern: /\bdelve\b|\bunravel\b|\btapestry\b|\bmyriad\b/i, issue: 'Forbidden words detected (delve, unravel, tapestry, myriad)' },
+  { pattern: /\bin the realm of\b|\bintricate\b|\bnuanced\b/i, issue: 'Forbidden AI-ism phrases detected (in the realm of, intricate, nuanced)' },
+  { pattern: /\bpivotal\b|\bcrucial\b/i, issue: 'Overused emphasis words detected (pivotal, crucial) - consider stronger alternatives' },
+  { pattern: /\ba testament to\b|\bserves as a reminder\b/i, issue: 'Forbidden cliche phrase detected' },
+  // Removed: "weight of/gravity of" - these are legitimate phrases in noir fiction
+  { pattern: /\bmoreover\b|\bfurthermore\b|\bin essence\b|\bconsequently\b|\badditionally\b/i, issue: 'Forbidden academic connectors detected' },
+  { pattern: /\bthis moment\b|\bthis realization\b|\bthis truth\b/i, issue: 'Forbidden meta-commentary detected ("this moment/realization/truth")' },
+  { pattern: /\bin that moment\b|\bat that instant\b|\bin the blink of an eye\b/i, issue: 'Forbidden time transition cliche detected' },
+  { pattern: /\bit'?s (?:important|worth) (?:to note|noting)\b/i, issue: 'Forbidden meta-phrase detected ("it\'s important/worth noting")' },
+];
+
+// Evocative noir metaphors used to gauge atmospheric texture
+const NOIR_METAPHOR_PATTERNS = [
+  /rain\s+(?:fell|poured|drummed|hammered|beat|washed|slicked|dripped)/i,
+  /shadow[s]?\s+(?:stretched|crawled|pooled|swallowed|embraced|clung)/i,
+  /neon\s+(?:bled|reflected|flickered|buzzed|hummed|painted|spilled)/i,
+  /city\s+(?:breathed|slept|whispered|groaned|stretched|waited)/i,
+  /silence\s+(?:hung|pressed|settled|wrapped|stretched|fell)/i,
+  /guilt\s+(?:weighed|gnawed|clawed|settled|wrapped|clung)/i,
+  /memory\s+(?:surfaced|lurked|haunted|clawed|whispered|echoed)/i,
+  /truth\s+(?:cut|burned|stung|waited|lurked|surfaced)/i,
+  /(?:voice|words?)\s+(?:cut|sliced|dripped|hung|fell|echoed)/i,
+  /eyes\s+(?:burned|bored|searched|narrowed|softened|hardened)/i,
+];
+
+// Sensory vocabulary per sense (global so match() returns every hit)
+const SENSORY_PATTERNS = {
+  visual: /\b(?:saw|watched|looked|glanced|neon|shadow|dark|light|glow|flicker|gleam|shine)\b/gi,
+  auditory: /\b(?:heard|sound|noise|whisper|echo|creak|hum|buzz|silence|quiet|jukebox|rain\s+(?:drummed|hammered|pattered))\b/gi,
+  tactile: /\b(?:felt|cold|warm|wet|damp|rough|smooth|grip|touch|chill|sting|burn)\b/gi,
+  olfactory: /\b(?:smell|scent|odor|stink|perfume|smoke|whiskey|rain|musk|sweat)\b/gi,
+  taste: /\b(?:taste|bitter|sweet|sour|whiskey|bourbon|coffee|blood)\b/gi,
+};
+
+// Phrases that feel AI-generated or generic
+const GENERIC_PHRASE_PATTERNS = [
+  { pattern: /\bthe air\s+(?:was|felt)\s+(?:thick|heavy|tense)\b/i, issue: 'Generic atmosphere: "the air was thick/heavy"' },
+  { pattern: /\bmy\s+(?:heart|pulse)\s+(?:raced|pounded|quickened)\b/i, issue: 'Generic tension: heart racing/pounding' },
+  { pattern: /\ba\s+(?:chill|shiver)\s+(?:ran|went)\s+down\s+(?:my|his|her)\s+spine\b/i, issue: 'Cliché: chill down spine' },
+  { pattern: /\btime\s+(?:seemed\s+to\s+)?(?:stood|stopped|froze|slowed)\b/i, issue: 'Cliché: time stopped/froze' },
+  { pattern: /\beverything\s+(?:changed|happened)\s+(?:so\s+)?fast\b/i, issue: 'Generic pacing: everything happened fast' },
+];
+
+// Stopwords used for choice-causality keyword extraction.
+// Include common noir/setting tokens so we don't get false positives like "truth/rain/case".
+// NOTE: Only includes canonical characters (Jack, Victoria/Blackwell) - others are LLM-generated.
+const CHOICE_CAUSALITY_STOPWORDS = new Set([
+  'jack', 'halloway', 'ashport', 'victoria', 'blackwell',
+  'said', 'the', 'and', 'that', 'with', 'from', 'into', 'then', 'over', 'under',
+  'were', 'was', 'had', 'have', 'this', 'there', 'their', 'they', 'them', 'what',
+  'when', 'where', 'which', 'while', 'because', 'before', 'after', 'could', 'would',
+  'should', 'about', 'again', 'still', 'truth', 'pattern', 'glyph', 'threshold', 'map',
+  'investigation', 'city', 'street', 'streets', 'office', 'night', 'days', 'years',
+  'choice', 'chose', 'decided', 'decision', 'option', 'path', 'plan',
+]);
+
+// Static word list for evidence board puzzle (puzzle redesign pending)
+const BOARD_STATIC_WORDS = Object.freeze([
+  'SHADOW', 'TRUTH', 'GLYPH', 'SILVER', 'TOKEN', 'ANCHOR',
+  'THRESHOLD', 'PATTERN', 'WITNESS', 'CIPHER', 'SIGNAL', 'TRACE',
+  'HIDDEN', 'PASSAGE', 'ARCHIVE', 'REFLECT',
+]);
+
+// Per-option defaults for the two branching outlier sets on a decision board
+const BOARD_BRANCH_SLOTS = [
+  { key: 'A', themeName: 'PATH A', icon: '\ud83d\udd34', summary: 'Option A' },
+  { key: 'B', themeName: 'PATH B', icon: '\ud83d\udd35', summary: 'Option B' },
+];
+
 class ValidationMethods {
   /**
    * Create a consistency checkpoint after generation
@@ -939,12 +1043,7 @@ class ValidationMethods {
     // The LLM has creative freedom to generate supporting characters with their own timelines.
 
     // Check for relative time references that could cause drift
-    const relativeTimePatterns = [
-      { pattern: /(?:nearly|almost|about|roughly)\s+(?:a\s+)?decade/i, issue: 'Avoid vague time references like "nearly a decade" - use exact durations' },
-      { pattern: /(?:many|several|countless)\s+years\s+(?:ago|since)/i, issue: 'Avoid vague "many/several years" - use exact durations from ABSOLUTE_FACTS' },
-    ];
-
-    relativeTimePatterns.forEach(({ pattern, issue }) => {
+    RELATIVE_TIME_PATTERNS.forEach(({ pattern, issue }) => {
       if (pattern.test(narrativeOriginal)) {
         warnings.push(issue); // Warning, not error, for vague references
       }
@@ -967,25 +1066,10 @@ class ValidationMethods {
         .join(' ')
         .toLowerCase();
 
-      // Stopwords used for choice-causality keyword extraction.
-      // Include common noir/setting tokens so we don't get false positives like "truth/rain/case".
-      // NOTE: Only includes canonical characters (Jack, Victoria/Blackwell) - others are LLM-generated.
-      const stop = new Set([
-        'jack', 'halloway', 'ashport', 'victoria', 'blackwell',
-        'said', 'the', 'and', 'that', 'with', 'from', 'into', 'then', 'over', 'under',
-        'were', 'was', 'had', 'have', 'this', 'there', 'their', 'they', 'them', 'what',
-        'when', 'where', 'which', 'while', 'because', 'before', 'after', 'could', 'would',
-        'should', 'about', 'again', 'still', 'truth', 'pattern', 'glyph', 'threshold', 'map',
-        'investigation', 'city', 'street', 'streets', 'office', 'night', 'days', 'years',
-        'choice', 'chose', 'decided', 'decision', 'option', 'path', 'plan',
-      ]);
       const seedText = `${context.lastDecision.immediate || ''} ${context.lastDecision.chosenTitle || ''} ${context.lastDecision.chosenFocus || ''}`;
+      // One regex pass yields the 4+ char alphanumeric runs the old replace/split/length filter produced.
       const keywords = [...new Set(
-        seedText
-          .toLowerCase()
-          .replace(/[^a-z0-9\s]/g, ' ')
-          .split(/\s+/)
-          .filter(w => w.length >= 4 && !stop.has(w))
+        (seedText.toLowerCase().match(/[a-z0-9]{4,}/g) || []).filter(w => !CHOICE_CAUSALITY_STOPWORDS.has(w))
       )].slice(0, 10);
 
       // Use word-based prefix matching to prevent false positives (e.g., "case" matching "showcase")
@@ -1010,12 +1094,7 @@ class ValidationMethods {
     // =========================================================================
     // CATEGORY 3: SETTING CONSISTENCY
     // =========================================================================
-    const settingViolations = [
-      { pattern: /\b(?:elf|elves|dwarf|dwarves|orc|orcs|goblin|goblins)\b/i, issue: 'Forbidden Tolkien-style fantasy element detected' },
-      { pattern: /\b(?:kingdom|castle|feudal|knight|sword\s+and\s+sorcery)\b/i, issue: 'Forbidden medieval-fantasy setting drift detected' },
-    ];
-
-    settingViolations.forEach(({ pattern, issue }) => {
+    SETTING_VIOLATION_PATTERNS.forEach(({ pattern, issue }) => {
       if (pattern.test(narrativeOriginal)) {
         issues.push(issue);
       }
@@ -1070,7 +1149,7 @@ class ValidationMethods {
       // Get critical threads that MUST be addressed (appointments and promises)
       const criticalThreads = context.narrativeThreads.filter(t =>
         t.status === 'active' &&
-        (t.type === 'appointment' || t.type === 'promise' || t.type === 'threat' || t.urgency === 'critical')
+        (URGENT_THREAD_TYPES.has(t.type) || t.urgency === 'critical')
       );
 
       if (criticalThreads.length > 0 && context.currentPosition.chapter > 2) {
@@ -1231,34 +1310,9 @@ class ValidationMethods {
     // =========================================================================
     // CATEGORY 7: FORBIDDEN WRITING PATTERNS
     // =========================================================================
-    const forbiddenPatterns = [
-      { pattern: /—/g, issue: 'Em dashes (—) found - use commas, periods, or semicolons instead', count: true },
-      // "Not just X; it's Y" AI patterns - extremely common LLM output
-      { pattern: /\bis not just\b.*\bit'?s\b/i, issue: 'Forbidden pattern: "X is not just Y, it\'s Z"' },
-      { pattern: /\bwasn'?t just\b.*;\s*it was\b/i, issue: 'Forbidden AI pattern: "It wasn\'t just X; it was Y"' },
-      { pattern: /\bdidn'?t just\b.*;\s*it\b/i, issue: 'Forbidden AI pattern: "It didn\'t just X; it Y"' },
-      { pattern: /\bnot just\b.*\bbut\b/i, issue: 'Forbidden pattern: "not just...but" construction' },
-      { pattern: /\bmore than just\b/i, issue: 'Forbidden pattern: "more than just"' },
-      { pattern: /\bin a world where\b/i, issue: 'Forbidden phrase: "In a world where..."' },
-      { pattern: /\blittle did (?:he|she|they|i|we) know\b/i, issue: 'Forbidden phrase: "Little did [anyone] know..."' },
-      { pattern: /\bi couldn'?t help but\b/i, issue: 'Forbidden phrase: "I couldn\'t help but..."' },
-      { pattern: /\bi found myself\b/i, issue: 'Forbidden phrase: "I found myself..."' },
-      { pattern: /\bseemingly\b|\binterestingly\b|\bnotably\b|\bcertainly\b|\bundoubtedly\b/i, issue: 'Forbidden flowery adverbs detected' },
-      { pattern: /\bundeniably\b|\bprofoundly\b|\bunmistakably\b|\binherently\b/i, issue: 'Forbidden AI-ism adverbs detected (undeniably, profoundly, unmistakably, inherently)' },
-      { pattern: /\bdelve\b|\bunravel\b|\btapestry\b|\bmyriad\b/i, issue: 'Forbidden words detected (delve, unravel, tapestry, myriad)' },
-      { pattern: /\bin the realm of\b|\bintricate\b|\bnuanced\b/i, issue: 'Forbidden AI-ism phrases detected (in the realm of, intricate, nuanced)' },
-      { pattern: /\bpivotal\b|\bcrucial\b/i, issue: 'Overused emphasis words detected (pivotal, crucial) - consider stronger alternatives' },
-      { pattern: /\ba testament to\b|\bserves as a reminder\b/i, issue: 'Forbidden cliche phrase detected' },
-      // Removed: "weight of/gravity of" - these are legitimate phrases in noir fiction
-      { pattern: /\bmoreover\b|\bfurthermore\b|\bin essence\b|\bconsequently\b|\badditionally\b/i, issue: 'Forbidden academic connectors detected' },
-      { pattern: /\bthis moment\b|\bthis realization\b|\bthis truth\b/i, issue: 'Forbidden meta-commentary detected ("this moment/realization/truth")' },
-      { pattern: /\bin that moment\b|\bat that instant\b|\bin the blink of an eye\b/i, issue: 'Forbidden time transition cliche detected' },
-      { pattern: /\bit'?s (?:important|worth) (?:to note|noting)\b/i, issue: 'Forbidden meta-phrase detected ("it\'s important/worth noting")' },
-    ];
-
     // Forbidden patterns are now WARNINGS, not errors
     // Stylistic preferences should not trigger expensive LLM retries
-    forbiddenPatterns.forEach(({ pattern, issue, count }) => {
+    FORBIDDEN_WRITING_PATTERNS.forEach(({ pattern, issue, count }) => {
       if (count) {
         const matches = narrativeOriginal.match(pattern);
         if (matches && matches.length > 0) {
@@ -1471,13 +1525,12 @@ class ValidationMethods {
     // Now uses urgency field for prioritization
     if (context.narrativeThreads && context.narrativeThreads.length > 0) {
       // Filter for threads that need resolution: critical urgency OR critical types with active status
-      const criticalThreadTypes = ['appointment', 'promise', 'threat'];
       const threadsToCheck = context.narrativeThreads.filter(t => {
         if (t.status !== 'active') return false;
         // Critical urgency threads must always be addressed
         if (t.urgency === 'critical') return true;
         // Critical types should also be addressed
-        if (criticalThreadTypes.includes(t.type)) return true;
+        if (URGENT_THREAD_TYPES.has(t.type)) return true;
         return false;
       });
 
@@ -1731,20 +1784,7 @@ class ValidationMethods {
 
     // ========== 1. METAPHOR DETECTION ==========
     // Noir prose should have evocative metaphors, not generic descriptions
-    const noirMetaphorPatterns = [
-      /rain\s+(?:fell|poured|drummed|hammered|beat|washed|slicked|dripped)/i,
-      /shadow[s]?\s+(?:stretched|crawled|pooled|swallowed|embraced|clung)/i,
-      /neon\s+(?:bled|reflected|flickered|buzzed|hummed|painted|spilled)/i,
-      /city\s+(?:breathed|slept|whispered|groaned|stretched|waited)/i,
-      /silence\s+(?:hung|pressed|settled|wrapped|stretched|fell)/i,
-      /guilt\s+(?:weighed|gnawed|clawed|settled|wrapped|clung)/i,
-      /memory\s+(?:surfaced|lurked|haunted|clawed|whispered|echoed)/i,
-      /truth\s+(?:cut|burned|stung|waited|lurked|surfaced)/i,
-      /(?:voice|words?)\s+(?:cut|sliced|dripped|hung|fell|echoed)/i,
-      /eyes\s+(?:burned|bored|searched|narrowed|softened|hardened)/i,
-    ];
-
-    const metaphorCount = noirMetaphorPatterns.reduce((count, pattern) => {
+    const metaphorCount = NOIR_METAPHOR_PATTERNS.reduce((count, pattern) => {
       return count + (narrative.match(pattern)?.length || 0);
     }, 0);
 
@@ -1758,17 +1798,9 @@ class ValidationMethods {
 
     // ========== 2. SENSORY DETAIL CHECK ==========
     // Strong prose engages multiple senses
-    const sensoryPatterns = {
-      visual: /\b(?:saw|watched|looked|glanced|neon|shadow|dark|light|glow|flicker|gleam|shine)\b/gi,
-      auditory: /\b(?:heard|sound|noise|whisper|echo|creak|hum|buzz|silence|quiet|jukebox|rain\s+(?:drummed|hammered|pattered))\b/gi,
-      tactile: /\b(?:felt|cold|warm|wet|damp|rough|smooth|grip|touch|chill|sting|burn)\b/gi,
-      olfactory: /\b(?:smell|scent|odor|stink|perfume|smoke|whiskey|rain|musk|sweat)\b/gi,
-      taste: /\b(?:taste|bitter|sweet|sour|whiskey|bourbon|coffee|blood)\b/gi,
-    };
-
     const sensoryHits = {};
     let totalSensory = 0;
-    for (const [sense, pattern] of Object.entries(sensoryPatterns)) {
+    for (const [sense, pattern] of Object.entries(SENSORY_PATTERNS)) {
       const matches = narrative.match(pattern) || [];
       sensoryHits[sense] = matches.length;
       totalSensory += matches.length;
@@ -1817,7 +1849,7 @@ class ValidationMethods {
 
     // ========== 5. OPENING QUALITY CHECK ==========
     const firstParagraph = paragraphs[0] || '';
-    const hasAtmosphericOpening = noirMetaphorPatterns.some(p => p.test(firstParagraph)) ||
+    const hasAtmosphericOpening = NOIR_METAPHOR_PATTERNS.some(p => p.test(firstParagraph)) ||
                                    /\b(?:rain|shadow|night|dark|neon|city|street)\b/i.test(firstParagraph);
 
     if (!hasAtmosphericOpening && wordCount > 200) {
@@ -1859,15 +1891,7 @@ class ValidationMethods {
 
     // ========== 7. GENERIC PHRASE DETECTION ==========
     // Detect phrases that feel AI-generated or generic
-    const genericPatterns = [
-      { pattern: /\bthe air\s+(?:was|felt)\s+(?:thick|heavy|tense)\b/i, issue: 'Generic atmosphere: "the air was thick/heavy"' },
-      { pattern: /\bmy\s+(?:heart|pulse)\s+(?:raced|pounded|quickened)\b/i, issue: 'Generic tension: heart racing/pounding' },
-      { pattern: /\ba\s+(?:chill|shiver)\s+(?:ran|went)\s+down\s+(?:my|his|her)\s+spine\b/i, issue: 'Cliché: chill down spine' },
-      { pattern: /\btime\s+(?:seemed\s+to\s+)?(?:stood|stopped|froze|slowed)\b/i, issue: 'Cliché: time stopped/froze' },
-      { pattern: /\beverything\s+(?:changed|happened)\s+(?:so\s+)?fast\b/i, issue: 'Generic pacing: everything happened fast' },
-    ];
-
-    for (const { pattern, issue } of genericPatterns) {
+    for (const { pattern, issue } of GENERIC_PHRASE_PATTERNS) {
       if (pattern.test(narrative)) {
         warnings.push(`${issue} - rewrite with more specific imagery`);
         qualityScore -= 3;
@@ -1948,7 +1972,7 @@ class ValidationMethods {
       .filter(t => {
         const isOverdue = t.dueChapter && currentChapter > t.dueChapter;
         const isCritical = t.urgency === 'critical';
-        const isUrgentType = ['appointment', 'promise', 'threat'].includes(t.type);
+        const isUrgentType = URGENT_THREAD_TYPES.has(t.type);
         return isOverdue || isCritical || isUrgentType;
       })
       .slice(0, 5); // Top 5 most critical threads
@@ -2427,21 +2451,16 @@ Rewrite the narrative to fix ALL issues while maintaining the story's thriller t
    * @param {object} decision - Decision data for decision points
    */
   _generateBoardData(isDecisionPoint, decision) {
-    // Static word list for evidence board puzzle (puzzle redesign pending)
-    const staticWords = [
-      'SHADOW', 'TRUTH', 'GLYPH', 'SILVER', 'TOKEN', 'ANCHOR',
-      'THRESHOLD', 'PATTERN', 'WITNESS', 'CIPHER', 'SIGNAL', 'TRACE',
-      'HIDDEN', 'PASSAGE', 'ARCHIVE', 'REFLECT'
-    ];
-
-    // Shuffle the static words
-    const shuffledWords = this._shuffleArray([...staticWords]);
+    // Shuffle the static words (_shuffleArray copies, so the frozen list is never mutated)
+    const shuffledWords = this._shuffleArray(BOARD_STATIC_WORDS);
 
     // Build 4x4 grid
-    const grid = [];
-    for (let row = 0; row < 4; row++) {
-      grid.push(shuffledWords.slice(row * 4, (row + 1) * 4));
-    }
+    const grid = [
+      shuffledWords.slice(0, 4),
+      shuffledWords.slice(4, 8),
+      shuffledWords.slice(8, 12),
+      shuffledWords.slice(12, 16),
+    ];
 
     // First 4 words are "outliers" (placeholder until puzzle redesign)
     const outlierWords = shuffledWords.slice(0, 4);
@@ -2458,32 +2477,22 @@ Rewrite the narrative to fix ALL issues while maintaining the story's thriller t
 
     // For decision points, split outliers into two sets
     if (isDecisionPoint && decision?.options?.length >= 2) {
-      boardResult.branchingOutlierSets = [
-        {
-          optionKey: decision.options[0].key || 'A',
-          key: decision.options[0].key || 'A',
-          label: decision.options[0].key || 'A',
+      boardResult.branchingOutlierSets = BOARD_BRANCH_SLOTS.map((slot, index) => {
+        const option = decision.options[index];
+        const key = option.key || slot.key;
+        return {
+          optionKey: key,
+          key,
+          label: key,
           theme: {
-            name: 'PATH A',
-            icon: '\ud83d\udd34',
-            summary: decision.options[0].focus || 'Option A',
+            name: slot.themeName,
+            icon: slot.icon,
+            summary: option.focus || slot.summary,
           },
-          words: outlierWords.slice(0, 2),
+          words: outlierWords.slice(index * 2, index * 2 + 2),
           descriptions: {},
-        },
-        {
-          optionKey: decision.options[1].key || 'B',
-          key: decision.options[1].key || 'B',
-          label: decision.options[1].key || 'B',
-          theme: {
-            name: 'PATH B',
-            icon: '\ud83d\udd35',
-            summary: decision.options[1].focus || 'Option B',
-          },
-          words: outlierWords.slice(2, 4),
-          descriptions: {},
-        },
-      ];
+        };
+      });
     }
 
     return boardResult;
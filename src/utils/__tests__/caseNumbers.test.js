@@ -0,0 +1,53 @@
+import { getBoardProfile } from '../caseNumbers';
+
+describe('getBoardProfile', () => {
+  it('returns the same frozen profile for repeated calls', () => {
+    const first = getBoardProfile('001A');
+    expect(getBoardProfile('001A')).toBe(first);
+    expect(Object.isFrozen(first)).toBe(true);
+    expect(first).toEqual({
+      chapter: 1,
+      subchapter: 1,
+      columns: 4,
+      rows: 4,
+      slots: 16,
+      outlierTarget: 4,
+      branching: false,
+    });
+  });
+
+  it('builds a separate profile for branching subchapters', () => {
+    const profile = getBoardProfile('002C');
+    expect(profile).not.toBe(getBoardProfile('002A'));
+    expect(getBoardProfile('002C')).toBe(profile);
+    expect(profile).toMatchObject({ rows: 5, slots: 20, outlierTarget: 8, branching: true });
+  });
+
+  it('shares a frozen default profile for missing or unparseable case numbers', () => {
+    const missing = getBoardProfile(undefined);
+    expect(getBoardProfile(undefined)).toBe(missing);
+    expect(Object.isFrozen(missing)).toBe(true);
+    expect(missing).toEqual({
+      chapter: null,
+      subchapter: null,
+      columns: 4,
+      rows: 4,
+      slots: 16,
+      outlierTarget: 4,
+      branching: false,
+    });
+
+    const unparseable = getBoardProfile('bogus');
+    expect(getBoardProfile('bogus')).toBe(unparseable);
+    expect(Object.isFrozen(unparseable)).toBe(true);
+    expect(unparseable).toEqual(missing);
+  });
+
+  it('rejects mutation of a shared profile in strict mode', () => {
+    const profile = getBoardProfile('003B');
+    expect(() => {
+      profile.rows = 6;
+    }).toThrow(TypeError);
+    expect(getBoardProfile('003B').rows).toBe(4);
+  });
+});
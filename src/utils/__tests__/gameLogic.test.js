@@ -3,7 +3,9 @@ import {
   shuffleArray,
   extractOutlierWords,
   extractMainWords,
+  generateBoardGrid,
 } from '../gameLogic';
+import { getBoardProfile } from '../caseNumbers';
 
 // Mock dependencies to isolate logic testing
 // Paths are relative to this test file: src/utils/__tests__/gameLogic.test.js
@@ -91,4 +93,49 @@ describe('Game Logic Utils', () => {
       expect(result).toEqual(['A', 'B']);
     });
   });
+
+  describe('generateBoardGrid', () => {
+    let warnSpy;
+
+    beforeEach(() => {
+      getBoardProfile.mockReturnValue({ columns: 4, rows: 4, slots: 16, outlierTarget: 4 });
+      warnSpy = jest.spyOn(console, 'warn').mockImplementation(() => {});
+    });
+
+    afterEach(() => {
+      warnSpy.mockRestore();
+    });
+
+    it('uses every available word once when the board is short', () => {
+      const caseData = {
+        caseNumber: '001A',
+        board: {
+          mainWords: ['A', 'B', 'A', 'W', 'C', 'D', 'E'],
+          outlierWords: ['W', 'X', 'Y', 'Z'],
+        },
+      };
+      const grid = generateBoardGrid(caseData);
+      const words = grid.flat();
+
+      expect(grid).toHaveLength(4);
+      expect(grid.every((row) => row.length <= 4)).toBe(true);
+      expect(words).toHaveLength(9);
+      expect([...words].sort()).toEqual(['A', 'B', 'C', 'D', 'E', 'W', 'X', 'Y', 'Z']);
+      expect(warnSpy).toHaveBeenCalledWith(expect.stringContaining('missing 7 words'));
+    });
+
+    it('fills a full board from the leading main words plus outliers', () => {
+      const mainWords = Array.from({ length: 20 }, (_, i) => `M${i}`);
+      const caseData = {
+        caseNumber: '001A',
+        board: { mainWords, outlierWords: ['X', 'Y', 'Z', 'Q'] },
+      };
+      const words = generateBoardGrid(caseData).flat();
+
+      expect(words).toHaveLength(16);
+      expect(new Set(words).size).toBe(16);
+      expect([...words].sort()).toEqual([...mainWords.slice(0, 12), 'Q', 'X', 'Y', 'Z'].sort());
+      expect(warnSpy).not.toHaveBeenCalled();
+    });
+  });
 });
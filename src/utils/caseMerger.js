@@ -32,11 +32,7 @@ export function mergeCaseWithStory(baseCase, storyCampaign, getStoryEntryFn) {
     
     // If the branching set structure has path keys, resolve the specific set for the current path
     if (branchingSet && !branchingSet.sets) {
-        if (branchingSet[pathKey]) {
-            branchingSet = branchingSet[pathKey];
-        } else if (branchingSet[ROOT_PATH_KEY]) {
-            branchingSet = branchingSet[ROOT_PATH_KEY];
-        }
+        branchingSet = branchingSet[pathKey] || branchingSet[ROOT_PATH_KEY] || branchingSet;
     }
     
     if (branchingSet && branchingSet.sets) {
@@ -47,9 +43,7 @@ export function mergeCaseWithStory(baseCase, storyCampaign, getStoryEntryFn) {
         const allSets = branchingSet.sets;
         
         // Flatten all words from all sets to create the master outlier list
-        const allOutlierWords = allSets.reduce((acc, set) => {
-            return [...acc, ...(set.words || [])];
-        }, []);
+        const allOutlierWords = allSets.flatMap(set => set.words || []);
 
         branchingBoardOverrides = {
             // The board needs to know the sets to color-code them (Red vs Blue paths)
@@ -62,7 +56,7 @@ export function mergeCaseWithStory(baseCase, storyCampaign, getStoryEntryFn) {
                 outliers: {
                     ...(baseCase.clueSummaries?.outliers || {}),
                     // Merge descriptions from all sets
-                    ...allSets.reduce((acc, set) => ({ ...acc, ...(set.descriptions || {}) }), {})
+                    ...Object.assign({}, ...allSets.map(set => set.descriptions || {}))
                 }
             }
         };
@@ -190,11 +184,7 @@ export async function mergeCaseWithStoryAsync(baseCase, storyCampaign, getStoryE
 
         // If the branching set structure has path keys, resolve the specific set
         if (branchingSet && !branchingSet.sets) {
-            if (branchingSet[pathKey]) {
-                branchingSet = branchingSet[pathKey];
-            } else if (branchingSet[ROOT_PATH_KEY]) {
-                branchingSet = branchingSet[ROOT_PATH_KEY];
-            }
+            branchingSet = branchingSet[pathKey] || branchingSet[ROOT_PATH_KEY] || branchingSet;
         }
     }
 
@@ -203,9 +193,7 @@ export async function mergeCaseWithStoryAsync(baseCase, storyCampaign, getStoryE
         const allSets = branchingSet.sets;
 
         // Flatten all words from all sets
-        const allOutlierWords = allSets.reduce((acc, set) => {
-            return [...acc, ...(set.words || [])];
-        }, []);
+        const allOutlierWords = allSets.flatMap(set => set.words || []);
 
         branchingBoardOverrides = {
             branchingOutlierSets: allSets,
@@ -214,7 +202,7 @@ export async function mergeCaseWithStoryAsync(baseCase, storyCampaign, getStoryE
                 ...(baseCase.clueSummaries || {}),
                 outliers: {
                     ...(baseCase.clueSummaries?.outliers || {}),
-                    ...allSets.reduce((acc, set) => ({ ...acc, ...(set.descriptions || {}) }), {})
+                    ...Object.assign({}, ...allSets.map(set => set.descriptions || {}))
                 }
             }
         };
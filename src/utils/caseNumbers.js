@@ -30,12 +30,21 @@ export function isBranchingSubchapter(caseNumber) {
   return meta.subchapter === 3 && meta.chapter < 12;
 }
 
+// Profiles are a pure function of the case number and are read-only everywhere,
+// so each one is built once and shared. A stable reference also keeps
+// `board.profile` memo dependencies from changing on every case merge.
+const BOARD_PROFILE_CACHE = new Map();
+
 export function getBoardProfile(caseNumber) {
+  const cached = BOARD_PROFILE_CACHE.get(caseNumber);
+  if (cached) {
+    return cached;
+  }
   const meta = parseCaseNumber(caseNumber);
   const branching = isBranchingSubchapter(caseNumber);
   const columns = 4;
   const rows = branching ? 5 : 4;
-  return {
+  const profile = Object.freeze({
     chapter: meta?.chapter ?? null,
     subchapter: meta?.subchapter ?? null,
     columns,
@@ -43,5 +52,7 @@ export function getBoardProfile(caseNumber) {
     slots: columns * rows,
     outlierTarget: branching ? 8 : 4,
     branching,
-  };
+  });
+  BOARD_PROFILE_CACHE.set(caseNumber, profile);
+  return profile;
 }
@@ -146,15 +146,13 @@ export function generateBoardGrid(caseData) {
     // Use a Set for O(1) duplicate checking
     const usedWords = new Set(uniqueCombined);
 
-    // If we need more words, try to fill from remaining mainPool and outlierWords
-    if (uniqueCombined.length < totalSlots) {
-        const allAvailable = [...mainPool, ...outlierWords];
-        for (const word of allAvailable) {
-            if (uniqueCombined.length >= totalSlots) break;
-            if (!usedWords.has(word)) {
-                uniqueCombined.push(word);
-                usedWords.add(word);
-            }
+    // If we need more words, fill from the rest of mainPool. Every outlier and every
+    // selected main word is already in usedWords, so only the unselected tail can add.
+    for (let i = requiredMainCount; i < mainPool.length && uniqueCombined.length < totalSlots; i += 1) {
+        const word = mainPool[i];
+        if (!usedWords.has(word)) {
+            uniqueCombined.push(word);
+            usedWords.add(word);
         }
     }
 
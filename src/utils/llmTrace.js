@@ -131,8 +131,8 @@ export function llmTrace(scope, traceId, event, data = {}, level = 'info') {
 
     logBuffer.push(entry);
     // Trim buffer if too large
-    while (logBuffer.length > MAX_LOG_BUFFER) {
-      logBuffer.shift();
+    if (logBuffer.length > MAX_LOG_BUFFER) {
+      logBuffer.splice(0, logBuffer.length - MAX_LOG_BUFFER);
     }
 
     // Notify subscribers
@@ -39,7 +39,8 @@ function forceRefine(nodes, connections, { width, height, padding, iterations =
     const ia = idIndex.get(c.a);
     const ib = idIndex.get(c.b);
     if (ia == null || ib == null || ia === ib) return;
-    const key = undirectedKey(String(ia), String(ib));
+    // Indices are < n, so min * n + max is a unique numeric key per undirected pair.
+    const key = ia < ib ? ia * n + ib : ib * n + ia;
     if (seenEdge.has(key)) return;
     seenEdge.add(key);
     edges.push([ia, ib]);
@@ -122,8 +123,9 @@ export function computeConstellationLayout(map, { width = 0, height = 0, padding
   const byChapter = new Map();
   fragments.forEach((f) => {
     const ch = chapterOf(f.firstCaseNumber || f.caseNumber || f.lastCaseNumber);
-    if (!byChapter.has(ch)) byChapter.set(ch, []);
-    byChapter.get(ch).push(f);
+    const group = byChapter.get(ch);
+    if (group) group.push(f);
+    else byChapter.set(ch, [f]);
   });
   const chapters = [...byChapter.keys()].sort((a, b) => a - b);
   const chapterCount = chapters.length;